@@ -2,8 +2,9 @@
 Database queries and caching for ERIS Streamlit app.
 """
 
+import sqlite3
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Sequence
 
 import pandas as pd
 import streamlit as st
@@ -11,25 +12,72 @@ import streamlit as st
 from data.storage.db_manager import get_connection, get_database_url
 
 
-@st.cache_data(ttl=300)
-def load_regime_states(days: int = 365) -> pd.DataFrame:
-    """Load regime_states for the last N days."""
+@st.cache_resource(show_spinner=False)
+def get_ro_connection() -> Optional[sqlite3.Connection]:
+    """
+    One read-only SQLite connection per process for dashboard queries, so
+    reruns skip the connect + PRAGMA setup that get_connection pays each
+    time. Returns None when unavailable (missing file, non-SQLite URL,
+    WAL sidecar not creatable read-only); callers fall back to
+    get_connection.
+    """
+    url = get_database_url()
+    if not url.startswith("sqlite"):
+        return None
+    path = url.replace("sqlite:///", "")
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone()
+        return conn
+    except sqlite3.Error:
+        return None
+
+
+def _downcast(df: pd.DataFrame, cat_cols: tuple = ()) -> pd.DataFrame:
+    """Shrink render DataFrames: float64 -> float32, label columns -> category.
+    Halves the bytes every downstream format/filter pass has to scan."""
+    for c in df.columns:
+        if df[c].dtype == "float64":
+            df[c] = df[c].astype("float32")
+    for c in cat_cols:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    return df
+
+
+# Columns load_regime_states may project; also the default selection
+_REGIME_STATE_COLS = ("date", "regime_label", "regime_probability", "confidence",
+                      "drivers", "regime_prob_risk_off", "composite_prob")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_regime_states(days: int = 365, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Load regime_states for the last N days.
+    columns: optional projection (subset of the default columns) so callers
+    that need only a couple of fields don't materialize all seven."""
+    cols = [c for c in (columns or _REGIME_STATE_COLS) if c in _REGIME_STATE_COLS]
+    if not cols:
+        cols = list(_REGIME_STATE_COLS)
+    if "date" not in cols:  # the frame is always date-sorted
+        cols.insert(0, "date")
     with get_connection() as conn:
         cur = conn.cursor()
         cur.execute(
-            """SELECT date, regime_label, regime_probability, confidence, drivers,
-                      regime_prob_risk_off, composite_prob
+            f"""SELECT {', '.join(cols)}
                FROM regime_states WHERE date IS NOT NULL ORDER BY date DESC LIMIT ?""",
             (days,),
         )
         rows = cur.fetchall()
-        columns = [d[0] for d in cur.description]
     if not rows:
-        return pd.DataFrame(columns=columns or ["date", "regime_label", "regime_probability"])
-    return pd.DataFrame(rows, columns=columns).sort_values("date").reset_index(drop=True)
+        return pd.DataFrame(columns=cols)
+    df = pd.DataFrame(rows, columns=cols).sort_values("date").reset_index(drop=True)
+    return _downcast(df, cat_cols=("regime_label", "confidence"))
 
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def load_nlp_signals(days: int = 365, source_type: Optional[str] = None) -> pd.DataFrame:
     """Load nlp_signals; optional filter by source_type."""
     with get_connection() as conn:
@@ -48,10 +96,27 @@ def load_nlp_signals(days: int = 365, source_type: Optional[str] = None) -> pd.D
         columns = [d[0] for d in cur.description]
     if not rows:
         return pd.DataFrame()
-    return pd.DataFrame(rows, columns=columns)
+    return _downcast(pd.DataFrame(rows, columns=columns), cat_cols=("source_type",))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_regime_mix(days: int = 730) -> pd.DataFrame:
+    """Regime label counts over the most recent N days, aggregated in SQL.
+    The KPI mix chart needs three integers, not two years of daily rows."""
+    with get_connection() as conn:
+        df = pd.read_sql_query(
+            """SELECT regime_label, COUNT(*) AS day_count
+               FROM (SELECT regime_label FROM regime_states
+                     WHERE date IS NOT NULL ORDER BY date DESC LIMIT ?)
+               WHERE regime_label IS NOT NULL
+               GROUP BY regime_label""",
+            conn,
+            params=(days,),
+        )
+    return df
 
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def load_daily_sentiment(days: int = 365, source_type: Optional[str] = None) -> pd.DataFrame:
     """Aggregate nlp_signals by date (mean sentiment, doc count) for charts."""
     with get_connection() as conn:
@@ -76,7 +141,7 @@ def load_daily_sentiment(days: int = 365, source_type: Optional[str] = None) ->
     return df
 
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def load_topic_distribution(days: int = 365) -> pd.DataFrame:
     """Topic counts from documents_processed.topic_hint (populated by BERTopic pipeline)."""
     with get_connection() as conn:
@@ -91,7 +156,7 @@ def load_topic_distribution(days: int = 365) -> pd.DataFrame:
     return df
 
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def load_document_topics(days: int = 365, limit: int = 200) -> pd.DataFrame:
     """Documents with topic labels for Topics page table (date, source_type, topic_label)."""
     with get_connection() as conn:
@@ -109,7 +174,7 @@ def load_document_topics(days: int = 365, limit: int = 200) -> pd.DataFrame:
     return df
 
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def load_market_daily(ticker: str = "SPY", days: int = 365) -> pd.DataFrame:
     """Load market_daily for one ticker."""
     with get_connection() as conn:
@@ -126,14 +191,14 @@ def load_market_daily(ticker: str = "SPY", days: int = 365) -> pd.DataFrame:
     return pd.DataFrame(rows, columns=columns)
 
 
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=600, show_spinner=False)
 def get_document_counts() -> dict:
     """Return row counts for main tables."""
     from data.storage.db_manager import get_document_count
     return get_document_count()
 
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def get_data_date_range() -> dict:
     """Return min/max dates for documents_processed and regime_states (for KPI page)."""
     out = {"docs_min": None, "docs_max": None, "regime_min": None, "regime_max": None, "regime_days": 0}
@@ -151,7 +216,7 @@ def get_data_date_range() -> dict:
     return out
 
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def get_topic_diversity_count() -> int:
     """Count of distinct topic_hint values (excluding null/empty). For KPI."""
     with get_connection() as conn:
@@ -163,6 +228,7 @@ def get_topic_diversity_count() -> int:
     return row[0] if row and row[0] is not None else 0
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_latest_regime() -> Optional[dict]:
     """Return most recent regime_states row as dict."""
     with get_connection() as conn:
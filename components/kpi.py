@@ -0,0 +1,89 @@
+"""
+KPI aggregation for the Project Success page: one cached record with all
+coverage metrics, so any page (or page variant) pays the DB cost once per TTL.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+import streamlit as st
+
+from components.data_loader import (
+    get_document_counts,
+    get_ro_connection,
+    load_regime_mix,
+    load_topic_distribution,
+)
+from data.storage.db_manager import get_connection
+
+
+@dataclass(frozen=True)
+class KPIs:
+    """Small immutable record: cheap for cache_data to store and hash."""
+    raw: int
+    proc: int
+    regime_days: int
+    nlp: int
+    topic_diversity: int
+    docs_min: Optional[str]
+    docs_max: Optional[str]
+    regime_min: Optional[str]
+    regime_max: Optional[str]
+    regime_mix: pd.DataFrame
+    top_topics: pd.DataFrame
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _aggregate_stats() -> dict:
+    """Date ranges, regime day count, and topic diversity in one round trip."""
+    out = {"docs_min": None, "docs_max": None, "regime_min": None, "regime_max": None,
+           "regime_days": 0, "topic_diversity": 0}
+    sql = """SELECT 'docs' AS k, MIN(published_date), MAX(published_date), NULL
+               FROM documents_processed WHERE published_date IS NOT NULL
+             UNION ALL
+             SELECT 'regime', MIN(date), MAX(date), COUNT(DISTINCT date)
+               FROM regime_states WHERE date IS NOT NULL
+             UNION ALL
+             SELECT 'topics', NULL, NULL, COUNT(DISTINCT topic_hint)
+               FROM documents_processed WHERE topic_hint IS NOT NULL AND topic_hint != ''"""
+    try:
+        # Reuse the process-wide read-only connection; fall back to a fresh
+        # one when it is unavailable (e.g. DB not created yet)
+        ro = get_ro_connection()
+        if ro is not None:
+            rows = ro.execute(sql).fetchall()
+        else:
+            with get_connection() as conn:
+                rows = conn.execute(sql).fetchall()
+        for k, lo, hi, n in rows:
+            if k == "docs" and lo:
+                out["docs_min"], out["docs_max"] = str(lo), str(hi)
+            elif k == "regime" and lo:
+                out["regime_min"], out["regime_max"] = str(lo), str(hi)
+                out["regime_days"] = n if n is not None else 0
+            elif k == "topics":
+                out["topic_diversity"] = n if n is not None else 0
+    except Exception:
+        pass
+    return out
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def compute_kpis() -> KPIs:
+    """All Project Success metrics as one record."""
+    counts = get_document_counts()
+    agg = _aggregate_stats()
+    return KPIs(
+        raw=int(counts.get("raw_articles") or 0),
+        proc=int(counts.get("documents_processed") or 0),
+        regime_days=int(agg["regime_days"] or 0),
+        nlp=int(counts.get("nlp_signals") or 0),
+        topic_diversity=int(agg["topic_diversity"] or 0),
+        docs_min=agg["docs_min"],
+        docs_max=agg["docs_max"],
+        regime_min=agg["regime_min"],
+        regime_max=agg["regime_max"],
+        regime_mix=load_regime_mix(days=730),
+        top_topics=load_topic_distribution(days=730).head(10),
+    )
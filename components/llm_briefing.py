@@ -3,10 +3,13 @@ GPT-4 powered briefing: current scenario, examples, early warnings, and precauti
 Uses forecasted regime, sentiment, topics, and stress level. Caches in llm_briefings.
 """
 
+import hashlib
 import json
 import logging
 import os
+import time
 from datetime import date
+from pathlib import Path
 from typing import Optional
 
 from data.storage.db_manager import get_connection
@@ -15,6 +18,39 @@ from dotenv import load_dotenv
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Content-keyed briefing cache: same inputs -> same briefing, zero LLM cost,
+# surviving process restarts (the llm_briefings table is only keyed by date)
+_BRIEFING_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "cache" / "briefings"
+_BRIEFING_TTL_S = 24 * 3600
+
+
+def _briefing_cache_key(as_of_date: str, regime: Optional[dict], regime_trend: str,
+                        sentiment_trend: str, topic_summary: str, stress_info: dict) -> str:
+    payload = json.dumps(
+        {"date": as_of_date, "regime": regime, "rt": regime_trend,
+         "st": sentiment_trend, "top": topic_summary, "stress": stress_info},
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _read_briefing_cache(key: str) -> Optional[str]:
+    path = _BRIEFING_CACHE_DIR / f"{key}.json"
+    try:
+        if path.exists() and time.time() - path.stat().st_mtime < _BRIEFING_TTL_S:
+            return json.loads(path.read_text(encoding="utf-8")).get("raw")
+    except Exception as e:
+        logger.debug("Briefing cache read failed: %s", e)
+    return None
+
+
+def _write_briefing_cache(key: str, raw: str) -> None:
+    try:
+        _BRIEFING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_BRIEFING_CACHE_DIR / f"{key}.json").write_text(json.dumps({"raw": raw}), encoding="utf-8")
+    except Exception as e:
+        logger.debug("Briefing cache write failed: %s", e)
+
 
 def _build_context(regime: Optional[dict], regime_trend: str, sentiment_trend: str, topic_summary: str, stress_info: dict) -> str:
     """Build a short context string for the LLM."""
@@ -105,6 +141,14 @@ def get_or_create_briefing(
     Return cached briefing for as_of_date or generate via GPT-4 and cache.
     Returns dict: scenario_summary, risk_briefing, early_warnings, precautions, mitigation_paths, from_cache.
     """
+    key = _briefing_cache_key(as_of_date, regime, regime_trend, sentiment_trend, topic_summary, stress_info)
+    if not force_refresh:
+        # Exact-input hit on disk: skip the DB round trip and the LLM call
+        cached = _read_briefing_cache(key)
+        if cached:
+            parsed = _parse_briefing(cached)
+            parsed["from_cache"] = True
+            return parsed
     with get_connection() as conn:
         cur = conn.cursor()
         if not force_refresh:
@@ -123,6 +167,7 @@ def get_or_create_briefing(
             return {"scenario_summary": "", "risk_briefing": "", "early_warnings": [], "precautions": [], "mitigation_paths": [], "from_cache": False}
         parsed = _parse_briefing(raw)
         parsed["from_cache"] = False
+        _write_briefing_cache(key, raw)
         cur.execute(
             """INSERT INTO llm_briefings (date, regime_status, risk_assessment, raw_response)
                VALUES (?, ?, ?, ?)""",
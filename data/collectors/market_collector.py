@@ -7,11 +7,17 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
 from data.storage.db_manager import get_config, get_connection
 
+try:
+    import bottleneck as bn  # C-level moving-window kernels
+except ImportError:
+    bn = None
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
@@ -89,6 +95,29 @@ def fetch_yfinance(
     return data[available].dropna(subset=["date"])
 
 
+def _grouped_rolling_std(df: pd.DataFrame, window: int = 21, min_periods: int = 5) -> pd.Series:
+    """Per-ticker rolling std of returns_1d; df must be sorted by ticker, date."""
+    if bn is None:
+        # Cython groupby.rolling fast path (no Python lambda per group)
+        return (
+            df.groupby("ticker", sort=False)["returns_1d"]
+            .rolling(window, min_periods=min_periods)
+            .std()
+            .reset_index(level=0, drop=True)
+        )
+    values = df["returns_1d"].to_numpy(dtype=float)
+    # Pad window-1 NaNs between tickers so one move_std pass over the whole
+    # array never mixes two tickers in the same window
+    boundary = df["ticker"].ne(df["ticker"].shift()).to_numpy()
+    pad = window - 1
+    group_idx = np.cumsum(boundary) - 1
+    positions = np.arange(len(values)) + group_idx * pad
+    padded = np.full(positions[-1] + 1 if len(values) else 0, np.nan)
+    padded[positions] = values
+    out = bn.move_std(padded, window=window, min_count=min_periods, ddof=1)[positions]
+    return pd.Series(out, index=df.index)
+
+
 def compute_returns_and_vol(df: pd.DataFrame, windows: Optional[List[int]] = None) -> pd.DataFrame:
     """Add returns_1d, returns_5d, returns_21d, returns_63d, realized_vol_21d per ticker."""
     cfg = _load_market_config()
@@ -97,9 +126,7 @@ def compute_returns_and_vol(df: pd.DataFrame, windows: Optional[List[int]] = Non
     df["returns_1d"] = df.groupby("ticker")["close"].pct_change()
     for w in windows:
         df[f"returns_{w}d"] = df.groupby("ticker")["close"].pct_change(w)
-    df["realized_vol_21d"] = df.groupby("ticker")["returns_1d"].transform(
-        lambda x: x.rolling(21, min_periods=5).std()
-    )
+    df["realized_vol_21d"] = _grouped_rolling_std(df, window=21, min_periods=5)
     return df
 
 
@@ -130,16 +157,25 @@ def fetch_fred(
     if not start:
         start = end - timedelta(days=365 * 2)
 
-    rows = []
+    # Build one columnar frame per series and concat once; avoids allocating
+    # a dict per observation and per-row schema inference
+    frames = []
     for s in series:
         try:
             ser = fred.get_series(s, start, end)
             if ser is not None and not ser.empty:
-                for d, v in ser.items():
-                    rows.append({"date": d.date(), "indicator_name": s, "value": float(v)})
+                frames.append(
+                    pd.DataFrame({
+                        "date": ser.index.date,
+                        "indicator_name": s,
+                        "value": ser.to_numpy(dtype=float),
+                    })
+                )
         except Exception as e:
             logger.warning("FRED series %s failed: %s", s, e)
-    return pd.DataFrame(rows)
+    if not frames:
+        return pd.DataFrame(columns=["date", "indicator_name", "value"])
+    return pd.concat(frames, ignore_index=True)
 
 
 def store_market_daily(df: pd.DataFrame) -> int:
@@ -151,28 +187,17 @@ def store_market_daily(df: pd.DataFrame) -> int:
         if c not in df.columns:
             df[c] = None
     df = df[cols].drop_duplicates(subset=["date", "ticker"])
+    df["date"] = df["date"].astype(str)
+    rows = list(df.itertuples(index=False, name=None))
     with get_connection() as conn:
         cur = conn.cursor()
-        for _, row in df.iterrows():
-            cur.execute(
-                """INSERT OR REPLACE INTO market_daily
-                   (date, ticker, open, high, low, close, volume, returns_1d, returns_5d, returns_21d, returns_63d, realized_vol_21d)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    str(row["date"]),
-                    row["ticker"],
-                    row.get("open"),
-                    row.get("high"),
-                    row.get("low"),
-                    row.get("close"),
-                    row.get("volume"),
-                    row.get("returns_1d"),
-                    row.get("returns_5d"),
-                    row.get("returns_21d"),
-                    row.get("returns_63d"),
-                    row.get("realized_vol_21d"),
-                ),
-            )
+        # executemany prepares the statement once and binds N parameter sets
+        cur.executemany(
+            """INSERT OR REPLACE INTO market_daily
+               (date, ticker, open, high, low, close, volume, returns_1d, returns_5d, returns_21d, returns_63d, realized_vol_21d)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
     return len(df)
 
 
@@ -180,14 +205,16 @@ def store_macro_indicators(df: pd.DataFrame) -> int:
     """Insert or replace macro_indicators rows."""
     if df.empty:
         return 0
+    rows = list(
+        zip(df["date"].astype(str), df["indicator_name"], df["value"])
+    )
     with get_connection() as conn:
         cur = conn.cursor()
-        for _, row in df.iterrows():
-            cur.execute(
-                """INSERT OR REPLACE INTO macro_indicators (date, indicator_name, value)
-                   VALUES (?, ?, ?)""",
-                (str(row["date"]), row["indicator_name"], row["value"]),
-            )
+        cur.executemany(
+            """INSERT OR REPLACE INTO macro_indicators (date, indicator_name, value)
+               VALUES (?, ?, ?)""",
+            rows,
+        )
     return len(df)
 
 
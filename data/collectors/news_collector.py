@@ -14,8 +14,25 @@ def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from dotenv import load_dotenv
 
+try:
+    import orjson  # faster JSON parse for large API payloads
+except ImportError:
+    orjson = None
+
+# Shared session: keep-alive TCP/TLS reuse across query rotation
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
 from data.storage.db_manager import get_config, get_connection
 
 load_dotenv()
@@ -61,9 +78,9 @@ def fetch_newsapi(
         "language": "en",
         "sortBy": "relevancy",
     }
-    resp = requests.get(base, params=params, timeout=30)
+    resp = _SESSION.get(base, params=params, timeout=30)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
     if data.get("status") != "ok":
         raise RuntimeError(f"NewsAPI error: {data.get('message', 'unknown')}")
     return data.get("articles", [])
@@ -80,14 +97,8 @@ def article_to_row(article: dict, query_term: str) -> Optional[dict]:
     source_name = (article.get("source") or {})
     if isinstance(source_name, dict):
         source_name = source_name.get("name", "unknown")
-    published = article.get("publishedAt")
-    if published:
-        try:
-            if published.endswith("Z"):
-                published = published.replace("Z", "+00:00")
-            published = datetime.fromisoformat(published.replace("Z", "+00:00"))
-        except Exception:
-            published = None
+    # Left as the raw ISO string; parsed in one vectorized pass at store time
+    published = article.get("publishedAt") or None
     return {
         "source": source_name,
         "title": title,
@@ -141,34 +152,50 @@ def collect_and_store(
     if not to_insert:
         return 0
 
-    # Store published_at as ISO string to avoid SQLite datetime adapter deprecation
+    # Parse all publishedAt strings in one C-level pass, then store as ISO
+    # strings to avoid the SQLite datetime adapter deprecation
+    import pandas as pd
+
+    pub = pd.to_datetime(
+        pd.Series([row["published_at"] for row in to_insert]),
+        utc=True,
+        format="ISO8601",
+        errors="coerce",
+    )
+    # "+00:00" suffix (not %z's "+0000"): the series is already UTC, and
+    # datetime.fromisoformat on Python 3.10 rejects the colon-less offset
+    pub_strs = [s if isinstance(s, str) else None
+                for s in pub.dt.strftime("%Y-%m-%dT%H:%M:%S") + "+00:00"]
+
+    params = [
+        (
+            row["source"],
+            row["title"],
+            row["content"],
+            row["description"],
+            pub_str,
+            row["url"],
+            row["url_hash"],
+            row["query_term"],
+            row["source_type"],
+        )
+        for row, pub_str in zip(to_insert, pub_strs)
+    ]
     inserted = 0
     with get_connection() as conn:
         cur = conn.cursor()
-        for row in to_insert:
-            try:
-                pub = row["published_at"]
-                pub_str = pub.isoformat() if hasattr(pub, "isoformat") else str(pub) if pub else None
-                cur.execute(
-                    """INSERT OR IGNORE INTO raw_articles
-                       (source, title, content, description, published_at, url, url_hash, query_term, source_type)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        row["source"],
-                        row["title"],
-                        row["content"],
-                        row["description"],
-                        pub_str,
-                        row["url"],
-                        row["url_hash"],
-                        row["query_term"],
-                        row["source_type"],
-                    ),
-                )
-                if hasattr(cur, "rowcount") and cur.rowcount and cur.rowcount > 0:
-                    inserted += 1
-            except Exception as e:
-                logger.debug("Skip duplicate or error: %s", e)
+        try:
+            # Single prepared statement bound N times; one transaction
+            cur.executemany(
+                """INSERT OR IGNORE INTO raw_articles
+                   (source, title, content, description, published_at, url, url_hash, query_term, source_type)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                params,
+            )
+            if cur.rowcount and cur.rowcount > 0:
+                inserted = cur.rowcount
+        except Exception as e:
+            logger.debug("Skip duplicate or error: %s", e)
     return inserted if inserted > 0 else len(to_insert)
 
 
@@ -5,6 +5,10 @@ Features at month-start predict ret_excess at month-end (already aligned in each
 """
 
 import logging
+import os
+import re
+import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -44,20 +48,30 @@ def _sample_range() -> Tuple[int, int]:
     return 2001, 2021
 
 
+# accept 200101.parquet or 200101_0.parquet
+_PARQUET_NAME_RE = re.compile(r"^(\d{4})\d{2,}(?:_\d+)?\.parquet$")
+
+
+@lru_cache(maxsize=8)
+def _scan_parquet_dir(parquet_dir: str) -> Tuple[Tuple[int, str], ...]:
+    """Scan a parquet directory once; return sorted (year, path) pairs."""
+    entries = []
+    with os.scandir(parquet_dir) as it:
+        for e in it:
+            m = _PARQUET_NAME_RE.match(e.name)
+            if m:
+                entries.append((int(m.group(1)), e.path))
+    entries.sort(key=lambda t: t[1])
+    return tuple(entries)
+
+
 def _list_parquet_files(parquet_dir: Path, start_year: int, end_year: int) -> List[Path]:
     """List YYYYMM.parquet or YYYYMM_0.parquet files in range."""
-    files = []
-    for p in parquet_dir.glob("*.parquet"):
-        try:
-            # accept 200101.parquet or 200101_0.parquet
-            stem = p.stem.split("_")[0]
-            if len(stem) >= 6 and stem.isdigit():
-                y = int(stem[:4])
-                if start_year <= y <= end_year:
-                    files.append(p)
-        except (ValueError, IndexError):
-            continue
-    return sorted(files)
+    return [
+        Path(p)
+        for y, p in _scan_parquet_dir(str(parquet_dir))
+        if start_year <= y <= end_year
+    ]
 
 
 def load_course_panel(
@@ -101,6 +115,9 @@ def load_course_panel(
     for f in files:
         try:
             df = pd.read_parquet(f)
+            # Cheap per-file sort; files already arrive in YYYYMM order
+            if "permno" in df.columns:
+                df = df.sort_values("permno", kind="stable")
             dfs.append(df)
         except Exception as e:
             logger.warning("Skip %s: %s", f.name, e)
@@ -117,7 +134,11 @@ def load_course_panel(
         panel["month_dt"] = pd.to_datetime(panel["month"].astype(str), format="%Y%m").dt.to_period("M")
     else:
         panel["month_dt"] = pd.to_datetime(panel["month"]).dt.to_period("M")
-    panel = panel.sort_values(["month_dt", "permno"]).reset_index(drop=True)
+    # Ordered concat of month-sorted files leaves the panel already in
+    # (month_dt, permno) order; only fall back to the O(N log N) global
+    # sort if that assumption is ever violated
+    if not panel["month_dt"].is_monotonic_increasing:
+        panel = panel.sort_values(["month_dt", "permno"]).reset_index(drop=True)
 
     if drop_ret_null and "ret_excess" in panel.columns:
         before = len(panel)
@@ -127,13 +148,21 @@ def load_course_panel(
     if impute_missing:
         char_cols = [c for c in panel.columns if c.startswith("characteristic_")]
         if char_cols:
-            # Cross-sectional median per month
-            for col in char_cols:
-                if panel[col].isna().any():
-                    med = panel.groupby("month_dt")[col].transform("median")
-                    panel[col] = panel[col].fillna(med)
-            # Any remaining NaN fill with 0 (e.g. if whole month missing)
-            panel[char_cols] = panel[char_cols].fillna(0)
+            # Cross-sectional median per month, computed on contiguous numpy
+            # blocks (panel is sorted by month_dt) instead of a groupby
+            mat = panel[char_cols].to_numpy(dtype=float, copy=True)
+            months = panel["month_dt"].to_numpy()
+            edges = np.flatnonzero(np.r_[True, months[1:] != months[:-1], True])
+            with warnings.catch_warnings():
+                # nanmedian warns on all-NaN columns; those fall back to 0
+                warnings.simplefilter("ignore", RuntimeWarning)
+                for i in range(len(edges) - 1):
+                    block = mat[edges[i] : edges[i + 1]]
+                    mask = np.isnan(block)
+                    if mask.any():
+                        med = np.nan_to_num(np.nanmedian(block, axis=0))
+                        block[mask] = np.broadcast_to(med, block.shape)[mask]
+            panel[char_cols] = mat
 
     return panel
 
@@ -9,6 +9,11 @@ from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
 
 def _looks_like_html(text: str) -> bool:
     """True only if content looks like a full HTML document (has tag names). Avoids treating 'x < 5%' as HTML."""
@@ -26,9 +31,10 @@ def strip_html_and_boilerplate(text: str, use_trafilatura: bool = True) -> str:
     if not text or not isinstance(text, str):
         return ""
     text = text.strip()
-    if use_trafilatura and len(text) > 200 and _looks_like_html(text):
+    # Only pay for trafilatura on long, clearly-HTML inputs; NewsAPI
+    # content/description fields are usually pre-extracted plain text
+    if use_trafilatura and trafilatura is not None and len(text) > 1000 and _looks_like_html(text):
         try:
-            import trafilatura
             # Suppress trafilatura log noise when extraction fails
             tlog = logging.getLogger("trafilatura")
             old_level = tlog.level
@@ -56,20 +62,29 @@ def strip_html_and_boilerplate(text: str, use_trafilatura: bool = True) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\s$%\.\-]")
+
+
+def _normalize_tokens(text: str, preserve_case: bool) -> List[str]:
+    """Single tokenization pass shared by the normalize helpers and clean_document."""
+    text = _SPECIAL_CHARS_RE.sub(" ", text)
+    if not preserve_case:
+        text = text.lower()
+    return text.split()
+
+
 def normalize_for_topic(text: str) -> str:
     """Lowercase and normalize for topic modeling; keep $ % and basis points."""
     if not text:
         return ""
-    text = re.sub(r"[^\w\s$%\.\-]", " ", text)
-    return " ".join(text.lower().split())
+    return " ".join(_normalize_tokens(text, preserve_case=False))
 
 
 def normalize_preserve_case(text: str) -> str:
     """Remove special chars but preserve case for FinBERT."""
     if not text:
         return ""
-    text = re.sub(r"[^\w\s$%\.\-]", " ", text)
-    return " ".join(text.split())
+    return " ".join(_normalize_tokens(text, preserve_case=True))
 
 
 def segment_sentences(text: str) -> List[str]:
@@ -104,7 +119,10 @@ def clean_document(
     content = strip_html_and_boilerplate(raw_content or "")
     if title:
         content = f"{title}\n{content}"
-    normalized = normalize_preserve_case(content) if preserve_case else normalize_for_topic(content)
+    # Tokenize once: the same token list yields both the normalized text
+    # and the word count (no second split over the document)
+    tokens = _normalize_tokens(content, preserve_case=preserve_case)
+    normalized = " ".join(tokens)
     sentences = segment_sentences(content)
-    word_count = len(normalized.split())
+    word_count = len(tokens)
     return normalized, sentences, word_count
@@ -4,10 +4,31 @@ Deduplication for ERIS using MinHash and Jaccard similarity.
 
 import hashlib
 import logging
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit, prange
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _max_jaccard(sig, sigs):  # pragma: no cover - compiled
+        """Max estimated Jaccard between `sig` and each row of `sigs`."""
+        best = 0.0
+        n = sig.shape[0]
+        for i in prange(sigs.shape[0]):
+            eq = 0
+            for j in range(n):
+                eq += sig[j] == sigs[i, j]
+            best = max(best, eq / n)
+        return best
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 
 def _get_shingles(text: str, k: int = 3) -> Set[str]:
     """Character k-shingles for MinHash."""
@@ -18,23 +39,92 @@ def _get_shingles(text: str, k: int = 3) -> Set[str]:
 
 
 def minhash_fingerprint(text: str, num_perm: int = 128) -> Optional[bytes]:
-    """Compute MinHash fingerprint. Returns bytes for storage; None if datasketch not available."""
+    """
+    Compute MinHash fingerprint. Returns bytes for storage; None if text is empty.
+
+    Stored as the raw little-endian uint32 signature (num_perm * 4 bytes) rather
+    than a pickled MinHash object: smaller blobs and no pickle round-trip on read.
+    """
     shingles = _get_shingles(text, k=3)
     if not shingles:
         return None
     try:
-        import pickle
         from datasketch import MinHash
         m = MinHash(num_perm=num_perm)
-        for s in shingles:
-            m.update(s.encode("utf-8"))
-        return pickle.dumps(m)
+        # Single vectorized permute-and-min over all shingles; byte-identical
+        # to (but ~3x faster than) a per-shingle update loop
+        m.update_batch([s.encode("utf-8") for s in shingles])
+        return m.hashvalues.astype("<u4").tobytes()
     except ImportError:
         # Fallback: simple hash of sorted shingles
         h = hashlib.sha256("|".join(sorted(shingles)).encode()).digest()
         return h
 
 
+class MinHashLSHIndex:
+    """
+    Banded LSH over raw MinHash signatures.
+
+    Signatures are split into `bands` bands of num_perm/bands values; two
+    documents are candidates only if they share at least one band verbatim,
+    so a duplicate check touches a handful of candidates instead of every
+    stored fingerprint (O(N) scan -> ~O(1) lookups).
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, threshold: float = 0.85):
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self._band_index: Dict[Tuple[int, bytes], List[int]] = {}
+        # Signatures live in one (capacity, num_perm) uint32 matrix so
+        # candidate verification is a single vectorized compare-reduce
+        self._sig_matrix = np.empty((16, num_perm), dtype=np.uint32)
+        self._n = 0
+
+    def _band_keys(self, fp: bytes):
+        band_bytes = self.rows * 4
+        for b in range(self.bands):
+            yield (b, fp[b * band_bytes : (b + 1) * band_bytes])
+
+    def _is_signature(self, fp) -> bool:
+        return isinstance(fp, bytes) and len(fp) == self.num_perm * 4
+
+    def add(self, fp: bytes) -> None:
+        """Index a raw signature; non-signature blobs (e.g. sha256 fallback) are ignored."""
+        if not self._is_signature(fp):
+            return
+        if self._n == len(self._sig_matrix):
+            self._sig_matrix = np.resize(self._sig_matrix, (self._n * 2, self.num_perm))
+        idx = self._n
+        self._sig_matrix[idx] = np.frombuffer(fp, dtype="<u4")
+        self._n += 1
+        for key in self._band_keys(fp):
+            self._band_index.setdefault(key, []).append(idx)
+
+    def is_duplicate(self, fp: bytes, threshold: Optional[float] = None) -> bool:
+        """True if any banded candidate's estimated Jaccard >= threshold."""
+        if not self._is_signature(fp):
+            return False
+        threshold = self.threshold if threshold is None else threshold
+        candidates: Set[int] = set()
+        for key in self._band_keys(fp):
+            candidates.update(self._band_index.get(key, ()))
+        if not candidates:
+            return False
+        sig = np.frombuffer(fp, dtype="<u4")
+        cand = np.fromiter(candidates, dtype=np.intp, count=len(candidates))
+        block = self._sig_matrix[cand]
+        if HAS_NUMBA:
+            return bool(_max_jaccard(sig, block) >= threshold)
+        # One compare-reduce over the stacked (K, num_perm) candidate block
+        sims = (block == sig).mean(axis=1)
+        return bool(np.any(sims >= threshold))
+
+    def __len__(self) -> int:
+        return self._n
+
+
 def jaccard_similarity(text_a: str, text_b: str, k: int = 3) -> float:
     """Jaccard similarity between two texts (shingle sets)."""
     sa, sb = _get_shingles(text_a, k), _get_shingles(text_b, k)
@@ -57,17 +147,17 @@ def is_duplicate(
     if not existing_fingerprints or threshold <= 0:
         return False
     try:
-        import pickle
-        from datasketch import MinHash
+        import numpy as np
         new_fp = minhash_fingerprint(text)
         if not new_fp:
             return False
-        new_m = pickle.loads(new_fp)
+        new_sig = np.frombuffer(new_fp, dtype="<u4")
         for fp in existing_fingerprints:
-            if isinstance(fp, bytes) and len(fp) > 0:
+            if isinstance(fp, bytes) and len(fp) == len(new_fp):
                 try:
-                    other = pickle.loads(fp)
-                    if new_m.jaccard(other) >= threshold:
+                    other_sig = np.frombuffer(fp, dtype="<u4")
+                    # Estimated Jaccard = fraction of matching signature slots
+                    if np.mean(new_sig == other_sig) >= threshold:
                         return True
                 except Exception:
                     continue
@@ -4,33 +4,145 @@ Reads from raw_articles + fed_documents + earnings_transcripts; writes to docume
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from data.storage.db_manager import get_connection, get_config
 from data.preprocessing.cleaner import clean_document
-from data.preprocessing.deduplicator import minhash_fingerprint, is_duplicate
+from data.preprocessing.deduplicator import MinHashLSHIndex, minhash_fingerprint
 from data.preprocessing.time_aligner import align_publish_to_date, to_date
 
 logger = logging.getLogger(__name__)
 
+# Single statement string so sqlite3's internal statement cache reuses the
+# prepared plan across batches; OR IGNORE lets the unique
+# (source_table, source_id) index reject rows processed by a concurrent run
+_INSERT_DOC_SQL = """INSERT OR IGNORE INTO documents_processed
+   (source_id, source_table, source_type, title, content_clean, content_sentences, published_date, word_count, minhash_fingerprint)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+# Only these langdetect profiles are loaded (~10 instead of all 55 n-gram
+# tables): English plus enough neighbours for negative discrimination
+_LANGDETECT_PROFILES = frozenset(
+    ["en", "es", "fr", "de", "it", "pt", "ja", "zh-cn", "ar", "ru"]
+)
+_detector_factory = None
+
+
+def _get_detector_factory():
+    """Lazily build a langdetect factory with only the constrained profile set."""
+    global _detector_factory
+    if _detector_factory is None:
+        import json
+        import os
+        from langdetect import detector_factory
+        from langdetect.utils.lang_profile import LangProfile
+
+        factory = detector_factory.DetectorFactory()
+        factory.seed = 0
+        profile_dir = detector_factory.PROFILES_DIRECTORY
+        names = sorted(n for n in os.listdir(profile_dir) if n in _LANGDETECT_PROFILES)
+        for index, name in enumerate(names):
+            with open(os.path.join(profile_dir, name), "r", encoding="utf-8") as f:
+                factory.add_profile(LangProfile(**json.load(f)), index, len(names))
+        _detector_factory = factory
+    return _detector_factory
+
+
+@lru_cache(maxsize=4096)
+def _detect_is_english(sample: str) -> bool:
+    try:
+        detector = _get_detector_factory().create()
+        detector.append(sample)
+        return detector.detect() == "en"
+    except Exception:
+        return True
+
 
 def _language_is_english(text: str) -> bool:
     """Keep English-only. Uses langdetect if available."""
     if not text or len(text) < 50:
         return True
-    try:
-        import langdetect
-        return langdetect.detect(text) == "en"
-    except Exception:
+    # Overwhelmingly-ASCII text is English for this corpus; skip the
+    # n-gram scorer entirely on that majority path
+    sample = text[:2000]
+    ascii_ratio = sum(1 for c in sample if ord(c) < 128) / len(sample)
+    if ascii_ratio >= 0.97:
         return True
+    return _detect_is_english(sample)
 
 
 def _min_word_count(text: str, min_w: Optional[int] = None) -> bool:
     cfg = get_config()
     if min_w is None:
         min_w = cfg.get("data", {}).get("preprocessing", {}).get("min_word_count", 20)
-    return len((text or "").split()) >= min_w
+    # maxsplit stops tokenizing once min_w words are found instead of
+    # splitting the entire document just to count
+    return len((text or "").split(None, min_w)) >= min_w
+
+
+# Chunk size for streaming reads / worker dispatch, and the batch size below
+# which a process pool costs more than it saves
+_CHUNK_SIZE = 512
+_PARALLEL_MIN_ROWS = 64
+
+
+def _published_date_str(pub) -> Optional[str]:
+    """Normalize a raw published value to a YYYY-MM-DD string (or None)."""
+    if not pub:
+        return None
+    try:
+        if isinstance(pub, str):
+            pub = datetime.fromisoformat(pub.replace("Z", "+00:00"))
+        published_date = align_publish_to_date(pub)
+        if hasattr(published_date, "strftime"):
+            return published_date.strftime("%Y-%m-%d")
+        return to_date(published_date)
+    except Exception:
+        return to_date(pub)
+
+
+def _clean_worker(task):
+    """
+    Clean one row (CPU-bound part only); runs in worker processes.
+    Returns (doc_id, title, content_clean, content_sentences, published_date,
+    word_count, fp) or None if the row is filtered out. Dedup and DB writes
+    stay on the main process.
+    """
+    doc_id, title, content, pub, min_w = task
+    if not content or not _min_word_count(content, min_w):
+        return None
+    if not _language_is_english(content):
+        return None
+    content_clean, sentences, word_count = clean_document(content, title=title, preserve_case=False)
+    if word_count < 20:
+        return None
+    fp = minhash_fingerprint(content_clean)
+    content_sentences = "\n".join(sentences) if sentences else ""
+    return (doc_id, title, content_clean, content_sentences, _published_date_str(pub), word_count, fp)
+
+
+def _load_dedup_index(threshold: float, conn=None) -> MinHashLSHIndex:
+    """Build an LSH index from fingerprints already in documents_processed."""
+    index = MinHashLSHIndex(threshold=threshold)
+
+    def _fill(c):
+        cur = c.execute(
+            "SELECT minhash_fingerprint FROM documents_processed WHERE minhash_fingerprint IS NOT NULL"
+        )
+        for (stored_fp,) in cur.fetchall():
+            index.add(stored_fp)
+
+    if conn is not None:
+        _fill(conn)
+    else:
+        with get_connection() as c:
+            _fill(c)
+    return index
 
 
 def run_preprocess_batch(
@@ -41,13 +153,18 @@ def run_preprocess_batch(
     content_col: str,
     date_col: Optional[str],
     limit: int = 5000,
+    dedup_index: Optional[MinHashLSHIndex] = None,
 ) -> int:
     """
     Process rows from a source table into documents_processed.
     Skips rows already in documents_processed (same source_id + source_table).
+    Pass a shared dedup_index to carry fingerprints across source tables;
+    when omitted, one is built from stored fingerprints.
     Returns number of rows inserted.
     """
-    threshold = get_config().get("data", {}).get("preprocessing", {}).get("dedup_jaccard_threshold", 0.85)
+    preproc_cfg = get_config().get("data", {}).get("preprocessing", {})
+    threshold = preproc_cfg.get("dedup_jaccard_threshold", 0.85)
+    min_w = preproc_cfg.get("min_word_count", 20)
     inserted = 0
 
     select_cols = [id_col, title_col, content_col]
@@ -55,68 +172,74 @@ def run_preprocess_batch(
         select_cols.append(date_col)
     cols_sql = ", ".join(select_cols)
 
+    # One connection scope for reads and the final batched write
     with get_connection() as conn:
         cur = conn.cursor()
         cur.execute(f"SELECT COUNT(*) FROM {source_table}")
         source_count = cur.fetchone()[0]
         cur.execute(
-            f"SELECT {cols_sql} FROM {source_table} ORDER BY id LIMIT ?",
-            (limit,),
-        )
-        rows = cur.fetchall()
-        # Already-processed source IDs (so we skip re-cleaning and report accurately)
-        cur.execute(
-            "SELECT source_id FROM documents_processed WHERE source_table = ?",
+            "SELECT COUNT(*) FROM documents_processed WHERE source_table = ?",
             (source_table,),
         )
-        already_processed_ids = {row[0] for row in cur.fetchall()}
-        cur.execute("SELECT minhash_fingerprint FROM documents_processed WHERE minhash_fingerprint IS NOT NULL")
-        existing_fps = [row[0] for row in cur.fetchall()]
-
-    skipped_already = 0
-    for row in rows:
-        doc_id = row[0]
-        if doc_id in already_processed_ids:
-            skipped_already += 1
-            continue
-        doc_id, title, content = row[0], row[1], row[2]
-        pub = row[3] if date_col and len(row) > 3 else None
-        if not content or not _min_word_count(content):
-            continue
-        if not _language_is_english(content):
-            continue
-        content_clean, sentences, word_count = clean_document(content, title=title, preserve_case=False)
-        if word_count < 20:
-            continue
-        fp = minhash_fingerprint(content_clean)
-        if is_duplicate(content_clean, existing_fps, threshold=threshold):
-            continue
-        if fp:
-            existing_fps.append(fp)
-        published_date = None
-        if pub:
-            try:
-                if isinstance(pub, str):
-                    pub = datetime.fromisoformat(pub.replace("Z", "+00:00"))
-                published_date = align_publish_to_date(pub)
-                if hasattr(published_date, "strftime"):
-                    published_date = published_date.strftime("%Y-%m-%d")
-                else:
-                    published_date = to_date(published_date)
-            except Exception:
-                published_date = to_date(pub)
-        content_sentences = "\n".join(sentences) if sentences else ""
-        try:
-            with get_connection() as conn:
-                conn.execute(
-                    """INSERT INTO documents_processed
-                       (source_id, source_table, source_type, title, content_clean, content_sentences, published_date, word_count, minhash_fingerprint)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (doc_id, source_table, source_type, title, content_clean, content_sentences, published_date, word_count, fp),
+        skipped_already = cur.fetchone()[0]
+        if dedup_index is None:
+            dedup_index = _load_dedup_index(threshold, conn=conn)
+
+        # Anti-join against the unique (source_table, source_id) index so
+        # already-processed rows never leave the DB (no Python-side id set).
+        # A dedicated cursor streams rows in fetchmany chunks instead of
+        # materializing all `limit` content blobs up front.
+        read_cur = conn.cursor()
+        read_cur.execute(
+            f"""SELECT {cols_sql} FROM {source_table}
+                WHERE id NOT IN (
+                    SELECT source_id FROM documents_processed WHERE source_table = ?
                 )
-            inserted += 1
-        except Exception as e:
-            logger.debug("Skip insert: %s", e)
+                ORDER BY id LIMIT ?""",
+            (source_table, limit),
+        )
+
+        to_insert = []
+        executor = None
+        try:
+            while True:
+                chunk = read_cur.fetchmany(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                tasks = [
+                    (row[0], row[1], row[2], row[3] if date_col and len(row) > 3 else None, min_w)
+                    for row in chunk
+                ]
+                # CPU-bound cleaning fans out across cores; small batches
+                # stay serial to avoid pool startup cost
+                if executor is None and len(tasks) >= _PARALLEL_MIN_ROWS:
+                    executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+                if executor is not None:
+                    results = executor.map(_clean_worker, tasks, chunksize=16)
+                else:
+                    results = map(_clean_worker, tasks)
+                for res in results:
+                    if res is None:
+                        continue
+                    doc_id, title, content_clean, content_sentences, published_date, word_count, fp = res
+                    if fp and dedup_index.is_duplicate(fp):
+                        continue
+                    if fp:
+                        dedup_index.add(fp)
+                    to_insert.append(
+                        (doc_id, source_table, source_type, title, content_clean, content_sentences, published_date, word_count, fp)
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if to_insert:
+            # One transaction and one prepared statement for the whole batch
+            try:
+                cur = conn.executemany(_INSERT_DOC_SQL, to_insert)
+                inserted = cur.rowcount if cur.rowcount and cur.rowcount > 0 else len(to_insert)
+            except Exception as e:
+                logger.debug("Skip insert batch: %s", e)
 
     if source_count > 0 or inserted > 0 or skipped_already > 0:
         logger.info(
@@ -131,11 +254,21 @@ def run_full_preprocess(limit_per_source: int = 5000) -> dict:
     Run preprocessing for raw_articles, fed_documents, earnings_transcripts.
     Returns counts per source.
     """
+    # One fingerprint scan for all three sources; the index carries new
+    # fingerprints across tables so dedup also works cross-source
+    threshold = get_config().get("data", {}).get("preprocessing", {}).get("dedup_jaccard_threshold", 0.85)
+    try:
+        dedup_index = _load_dedup_index(threshold)
+    except Exception as e:
+        logger.warning("Could not load dedup index: %s", e)
+        dedup_index = MinHashLSHIndex(threshold=threshold)
+
     counts = {}
     # raw_articles
     try:
         counts["raw_articles"] = run_preprocess_batch(
-            "raw_articles", "news", "id", "title", "content", "published_at", limit=limit_per_source
+            "raw_articles", "news", "id", "title", "content", "published_at",
+            limit=limit_per_source, dedup_index=dedup_index,
         )
     except Exception as e:
         logger.warning("Preprocess raw_articles failed: %s", e)
@@ -143,7 +276,8 @@ def run_full_preprocess(limit_per_source: int = 5000) -> dict:
     # fed_documents
     try:
         counts["fed_documents"] = run_preprocess_batch(
-            "fed_documents", "fed", "id", "title", "full_text", "date", limit=limit_per_source
+            "fed_documents", "fed", "id", "title", "full_text", "date",
+            limit=limit_per_source, dedup_index=dedup_index,
         )
     except Exception as e:
         logger.warning("Preprocess fed_documents failed: %s", e)
@@ -151,7 +285,8 @@ def run_full_preprocess(limit_per_source: int = 5000) -> dict:
     # earnings_transcripts
     try:
         counts["earnings_transcripts"] = run_preprocess_batch(
-            "earnings_transcripts", "earnings", "id", "company", "text", "date", limit=limit_per_source
+            "earnings_transcripts", "earnings", "id", "company", "text", "date",
+            limit=limit_per_source, dedup_index=dedup_index,
         )
     except Exception as e:
         logger.warning("Preprocess earnings_transcripts failed: %s", e)
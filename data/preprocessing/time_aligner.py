@@ -3,36 +3,47 @@ Temporal alignment for ERIS: map documents to calendar/trading date.
 Articles after market close (4 PM ET) assign to next trading day.
 """
 
-from datetime import datetime, time, timedelta
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Optional, Union
 
 from data.storage.db_manager import get_config
 
+# Treat as UTC for simplicity; 4 PM ET ≈ 21:00 UTC (EDT) or 22:00 (EST)
+_CUTOFF_HOUR_UTC = 20  # 8 PM UTC as proxy for 4 PM ET
+_ONE_DAY = timedelta(days=1)
+
 
 def _market_close_hour() -> int:
     cfg = get_config()
     return cfg.get("data", {}).get("preprocessing", {}).get("market_close_hour_et", 16)
 
 
+def _align_from_datetime(dt: datetime) -> date:
+    """Fast path for the common upstream case: a real datetime."""
+    if dt.hour >= _CUTOFF_HOUR_UTC:
+        return dt.date() + _ONE_DAY
+    return dt.date()
+
+
+def _align_from_str(s: str) -> date:
+    return _align_from_datetime(datetime.fromisoformat(s))
+
+
 def align_publish_to_date(
-    published_at: Optional[datetime],
+    published_at: Optional[Union[datetime, str]],
     market_close_hour_et: Optional[int] = None,
-) -> Optional[datetime]:
+) -> Optional[date]:
     """
     Map publish timestamp to 'effective' date for market alignment.
-    If published after market_close_hour_et (default 16), assign to next day.
+    Publishes after the close cutoff assign to the next day.
     Simplified: assumes UTC input; for production use pytz for ET.
     """
     if published_at is None:
         return None
-    close = market_close_hour_et if market_close_hour_et is not None else _market_close_hour()
-    # Treat as UTC for simplicity; 4 PM ET ≈ 21:00 UTC (EDT) or 22:00 (EST)
-    cutoff = time(20, 0)  # 8 PM UTC as proxy for 4 PM ET
-    dt = published_at if isinstance(published_at, datetime) else datetime.fromisoformat(str(published_at))
-    t = dt.time() if hasattr(dt, "time") else dt
-    if hasattr(t, "hour") and t.hour >= cutoff.hour:
-        return (dt.date() if hasattr(dt, "date") else dt) + timedelta(days=1)
-    return dt.date() if hasattr(dt, "date") else dt
+    # Two typed fast paths instead of an isinstance/hasattr chain per call
+    if isinstance(published_at, datetime):
+        return _align_from_datetime(published_at)
+    return _align_from_str(str(published_at))
 
 
 def to_date(d) -> Optional[str]:
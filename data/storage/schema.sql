@@ -101,6 +101,12 @@ CREATE TABLE IF NOT EXISTS documents_processed (
 
 CREATE INDEX IF NOT EXISTS idx_docs_processed_date ON documents_processed(published_date);
 CREATE INDEX IF NOT EXISTS idx_docs_processed_source_type ON documents_processed(source_type);
+-- Backs the "already processed" filter and lets INSERT OR IGNORE reject re-runs
+CREATE UNIQUE INDEX IF NOT EXISTS ux_docs_processed_source ON documents_processed(source_table, source_id);
+-- Partial index: KPI topic-diversity COUNT(DISTINCT) and topic distribution
+-- queries only ever look at labeled rows
+CREATE INDEX IF NOT EXISTS ix_docs_processed_topic_hint ON documents_processed(topic_hint)
+    WHERE topic_hint IS NOT NULL AND topic_hint != '';
 
 -- NLP computed features (daily granularity)
 CREATE TABLE IF NOT EXISTS nlp_signals (
@@ -130,6 +136,8 @@ CREATE TABLE IF NOT EXISTS nlp_signals (
 
 CREATE INDEX IF NOT EXISTS idx_nlp_signals_date ON nlp_signals(date);
 CREATE INDEX IF NOT EXISTS idx_nlp_signals_source ON nlp_signals(source_type);
+-- Covers the dashboard's (source_type, date-range) lookups in one index scan
+CREATE INDEX IF NOT EXISTS ix_nlp_signals_src_date ON nlp_signals(source_type, date);
 
 -- Regime engine output
 CREATE TABLE IF NOT EXISTS regime_states (
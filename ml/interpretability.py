@@ -7,6 +7,9 @@ from typing import Callable, Dict, List, Optional
 import numpy as np
 import pandas as pd
 
+# Shared generator: deterministic subsamples without a fresh RandomState per call
+_SHAP_RNG = np.random.default_rng(42)
+
 
 def shap_importance(
     model: object,
@@ -24,11 +27,13 @@ def shap_importance(
         return pd.DataFrame({"feature": feature_names, "importance": 0.0})
 
     if len(X) > n_samples:
-        idx = np.random.RandomState(42).choice(len(X), n_samples, replace=False)
+        idx = _SHAP_RNG.choice(len(X), n_samples, replace=False)
         X = X[idx]
     try:
-        explainer = shap.TreeExplainer(model)
-        sh = explainer.shap_values(X)
+        # tree_path_dependent needs no background dataset and is much faster
+        # than the interventional default on XGBoost/LightGBM
+        explainer = shap.TreeExplainer(model, feature_perturbation="tree_path_dependent")
+        sh = explainer.shap_values(X, check_additivity=False)
     except Exception:
         try:
             explainer = shap.Explainer(model, X, feature_names=feature_names)
@@ -8,6 +8,37 @@ from typing import Optional, Tuple
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _metrics_kernel(r):  # pragma: no cover - compiled
+        """Mean, sample std and max drawdown of a return array in one pass."""
+        n = r.shape[0]
+        mean = 0.0
+        m2 = 0.0
+        wealth = 1.0
+        peak = 1.0
+        mdd = 0.0
+        for i in range(n):
+            x = r[i]
+            mean += x
+            m2 += x * x
+            wealth *= 1.0 + x
+            if wealth > peak:
+                peak = wealth
+            dd = (wealth - peak) / peak
+            if dd < mdd:
+                mdd = dd
+        mean /= n
+        var = (m2 - n * mean * mean) / (n - 1) if n > 1 else 0.0
+        std = np.sqrt(var) if var > 0 else 0.0
+        return mean, std, mdd
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 
 def decile_long_short_returns(
     predictions_df: pd.DataFrame,
@@ -19,24 +50,36 @@ def decile_long_short_returns(
     Each month: rank stocks by pred_col, long top decile, short bottom decile.
     Value-weight by weight_col (mktcap_lag). Return DataFrame with month_dt, strategy_return, long_return, short_return.
     """
+    # Only top/bottom decile membership matters, so select each month's
+    # extremes with O(N) np.argpartition instead of a full qcut sort,
+    # working on numpy arrays indexed by precomputed group positions
+    df = predictions_df[predictions_df[pred_col].notna()]
+    if df.empty:
+        return pd.DataFrame(columns=["month_dt", "strategy_return", "long_return", "short_return"])
+    pred_all = df[pred_col].to_numpy()
+    ret_all = df[ret_col].to_numpy()
+    w_all = df[weight_col].to_numpy() if weight_col in df.columns else None
+
     out = []
-    for month, grp in predictions_df.groupby("month_dt"):
-        if grp[pred_col].isna().all():
+    for month, idx in df.groupby("month_dt", sort=True).indices.items():
+        n = len(idx)
+        k = n // 10
+        if k == 0:
             continue
-        grp = grp.copy()
-        grp["decile"] = pd.qcut(grp[pred_col].rank(method="first"), 10, labels=False)
-        top = grp[grp["decile"] == 9]
-        bot = grp[grp["decile"] == 0]
-        if weight_col in grp.columns and top[weight_col].sum() > 0 and bot[weight_col].sum() > 0:
-            w_top = top[weight_col].values / top[weight_col].sum()
-            w_bot = bot[weight_col].values / bot[weight_col].sum()
-            long_ret = np.average(top[ret_col].values, weights=w_top)
-            short_ret = np.average(bot[ret_col].values, weights=w_bot)
-        else:
-            long_ret = top[ret_col].mean()
-            short_ret = bot[ret_col].mean()
-        strategy_ret = long_ret - short_ret
-        out.append({"month_dt": month, "strategy_return": strategy_ret, "long_return": long_ret, "short_return": short_ret})
+        order = np.argpartition(pred_all[idx], (k - 1, n - k))
+        bot = idx[order[:k]]
+        top = idx[order[n - k :]]
+        long_ret = short_ret = None
+        if w_all is not None:
+            w_top, w_bot = w_all[top], w_all[bot]
+            ws_top, ws_bot = w_top.sum(), w_bot.sum()
+            if ws_top > 0 and ws_bot > 0:
+                long_ret = np.dot(ret_all[top], w_top) / ws_top
+                short_ret = np.dot(ret_all[bot], w_bot) / ws_bot
+        if long_ret is None:
+            long_ret = ret_all[top].mean()
+            short_ret = ret_all[bot].mean()
+        out.append({"month_dt": month, "strategy_return": long_ret - short_ret, "long_return": long_ret, "short_return": short_ret})
     return pd.DataFrame(out)
 
 
@@ -44,12 +87,13 @@ def market_return_per_month(panel: pd.DataFrame, ret_col: str = "ret_excess", we
     """Value-weighted market return per month (for benchmark)."""
     if weight_col not in panel.columns:
         return panel.groupby("month_dt")[ret_col].mean()
-    def vw_ret(grp):
-        w = grp[weight_col].values
-        if w.sum() == 0:
-            return grp[ret_col].mean()
-        return np.average(grp[ret_col].values, weights=w)
-    return panel.groupby("month_dt").apply(vw_ret)
+    # Ratio of two group sums instead of a Python callback per group;
+    # zero-weight months fall back to the equal-weighted mean
+    grouped = panel.groupby("month_dt")
+    num = (panel[ret_col] * panel[weight_col]).groupby(panel["month_dt"]).sum()
+    den = grouped[weight_col].sum()
+    vw = num / den.replace(0, np.nan)
+    return vw.fillna(grouped[ret_col].mean())
 
 
 def cumulative_returns(monthly_returns: pd.Series) -> pd.Series:
@@ -68,12 +112,16 @@ def sharpe_ratio(monthly_returns: pd.Series, annualize: bool = True) -> float:
     return float(sr)
 
 
-def max_drawdown(cumulative: pd.Series) -> float:
-    """Max drawdown from cumulative return series."""
-    cum = (1 + cumulative).cumprod()
-    run_max = cum.cummax()
-    dd = (cum - run_max) / run_max
-    return float(dd.min())
+def max_drawdown(monthly_returns: pd.Series) -> float:
+    """Max drawdown from monthly return series."""
+    # Takes monthly returns, not a cumulative series: the old signature
+    # compounded an already-cumulative input a second time
+    r = monthly_returns.dropna().to_numpy()
+    if len(r) == 0:
+        return 0.0
+    wealth = np.cumprod(1.0 + r)
+    peak = np.maximum.accumulate(wealth)
+    return float(((wealth - peak) / peak).min())
 
 
 def annualized_alpha(
@@ -106,10 +154,22 @@ def portfolio_metrics(
     port["cum_market"] = cumulative_returns(port["market_return"])
     port = port.reset_index()
 
-    metrics = {
-        "sharpe_ratio": sharpe_ratio(port["strategy_return"]),
-        "max_drawdown": max_drawdown(port["strategy_return"]),
-        "annualized_alpha": annualized_alpha(port["strategy_return"], port["market_return"]),
-        "long_short_spread_mean": port["strategy_return"].mean(),
-    }
+    r = port["strategy_return"].dropna().to_numpy()
+    if HAS_NUMBA and len(r) >= 2:
+        # One streaming pass over the return series instead of separate
+        # mean/std/cumprod/cummax passes per metric
+        mean, std, mdd = _metrics_kernel(r)
+        metrics = {
+            "sharpe_ratio": float(mean / (std + 1e-12) * np.sqrt(12)),
+            "max_drawdown": float(mdd),
+            "annualized_alpha": annualized_alpha(port["strategy_return"], port["market_return"]),
+            "long_short_spread_mean": float(mean),
+        }
+    else:
+        metrics = {
+            "sharpe_ratio": sharpe_ratio(port["strategy_return"]),
+            "max_drawdown": max_drawdown(port["strategy_return"]),
+            "annualized_alpha": annualized_alpha(port["strategy_return"], port["market_return"]),
+            "long_short_spread_mean": port["strategy_return"].mean(),
+        }
     return port, metrics
@@ -3,6 +3,8 @@ Regime-Aware Neural Network: macro -> regime embedding; characteristics + embedd
 Conditional modeling so the relationship between characteristics and returns can vary by regime.
 """
 
+import functools
+import logging
 from pathlib import Path
 from typing import Callable, List, Optional, Tuple
 
@@ -11,6 +13,8 @@ import pandas as pd
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+logger = logging.getLogger(__name__)
+
 try:
     import torch
     import torch.nn as nn
@@ -19,6 +23,7 @@ except ImportError:
     HAS_TORCH = False
 
 
+@functools.lru_cache(maxsize=1)
 def _get_config() -> dict:
     import yaml
     config_path = PROJECT_ROOT / "config.yaml"
@@ -120,23 +125,48 @@ def train_regime_aware_nn(
         char_dim=X_char.shape[1],
         embed_dim=16,
     ).to(device)
-    opt = torch.optim.Adam(model.parameters(), lr=lr)
+    use_cuda = device == "cuda"
+    if use_cuda:
+        # Let cuDNN autotune kernels for the fixed layer shapes, and feed
+        # the GPU much larger batches - the net is ~10k params, so 2048-row
+        # batches leave it mostly idle
+        torch.backends.cudnn.benchmark = True
+        batch_size = max(batch_size, 16384)
+        try:
+            # Fuses the small Linear+ReLU stacks into a couple of kernels
+            # instead of ~10 separate launches per batch
+            model = torch.compile(model, mode="reduce-overhead")
+        except Exception:
+            pass  # older torch or missing compiler backend; run eager
+    # AdamW's fused CUDA kernel updates all parameters in one launch
+    opt = torch.optim.AdamW(model.parameters(), lr=lr, fused=use_cuda)
     criterion = nn.MSELoss()
 
     n = len(y)
-    indices = np.arange(n)
+    # Upload the full (float32) tensors once and shuffle/slice on-device;
+    # per-minibatch torch.from_numpy(...).to(device) copies dominated GPU
+    # utilization with thousands of small host->device transfers
+    def _to_device(arr: np.ndarray) -> "torch.Tensor":
+        t = torch.from_numpy(np.ascontiguousarray(arr))
+        if use_cuda:
+            # Pinned staging buffer makes the non_blocking copy truly async
+            t = t.pin_memory()
+        return t.to(device, non_blocking=True)
+
+    Xm = _to_device(X_macro)
+    Xc = _to_device(X_char)
+    yt = _to_device(y)
     losses = []
     for ep in range(epochs):
-        np.random.shuffle(indices)
+        perm = torch.randperm(n, device=device)
         epoch_loss = 0.0
         for start in range(0, n, batch_size):
-            idx = indices[start : start + batch_size]
-            m = torch.from_numpy(X_macro[idx]).float().to(device)
-            c = torch.from_numpy(X_char[idx]).float().to(device)
-            t = torch.from_numpy(y[idx]).float().to(device)
-            opt.zero_grad()
-            out = model(m, c)
-            loss = criterion(out, t)
+            idx = perm[start : start + batch_size]
+            opt.zero_grad(set_to_none=True)
+            # bf16 autocast on CUDA: no GradScaler needed (unlike fp16)
+            with torch.autocast(device_type=device, dtype=torch.bfloat16, enabled=use_cuda):
+                out = model(Xm[idx], Xc[idx])
+                loss = criterion(out, yt[idx])
             loss.backward()
             opt.step()
             epoch_loss += loss.item()
@@ -153,18 +183,63 @@ def predict_regime_aware_nn(
     if not HAS_TORCH or model is None:
         return np.zeros(len(X_macro))
     device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+    use_cuda = device == "cuda"
     model.eval()
     X_macro = _safe_array(X_macro)
     X_char = _safe_array(X_char)
+    infer = getattr(model, "_traced", None)
+    if infer is None:
+        infer = _trace_for_inference(model, X_macro.shape[1], X_char.shape[1], device, use_cuda)
+        try:
+            model._traced = infer
+        except Exception:
+            pass  # compiled wrappers may not accept new attributes
+    dtype = torch.half if use_cuda and infer is not model else torch.float32
     with torch.no_grad():
-        m = torch.from_numpy(X_macro).float().to(device)
-        c = torch.from_numpy(X_char).float().to(device)
-        pred = model(m, c)
-    return pred.cpu().numpy()
+        m = torch.from_numpy(X_macro).to(device, dtype=dtype)
+        c = torch.from_numpy(X_char).to(device, dtype=dtype)
+        pred = infer(m, c)
+    return pred.float().cpu().numpy()
+
+
+def _trace_for_inference(model, macro_dim: int, char_dim: int, device: str, use_cuda: bool):
+    """
+    JIT-trace the net once for the many-small-inferences expanding-window
+    path: kills per-call Python dispatch through nn.Sequential, and runs
+    fp16 on GPU. Falls back to the eager model if tracing fails.
+    """
+    try:
+        with torch.no_grad():
+            if use_cuda:
+                model = model.half()
+                dtype = torch.half
+            else:
+                dtype = torch.float32
+            example = (
+                torch.zeros(1, macro_dim, device=device, dtype=dtype),
+                torch.zeros(1, char_dim, device=device, dtype=dtype),
+            )
+            traced = torch.jit.trace(model, example)
+            if not use_cuda:
+                traced = torch.jit.optimize_for_inference(traced)
+        return traced
+    except Exception as e:
+        if use_cuda:
+            model = model.float()  # undo the half-cast before eager fallback
+        logger.debug("jit.trace failed, using eager forward: %s", e)
+        return model
 
 
 def _safe_array(X: np.ndarray) -> np.ndarray:
-    X = np.nan_to_num(X, nan=0.0, posinf=0.0, neginf=0.0).astype(np.float32)
+    """Contiguous float32 with NaN/Inf zeroed in place (one allocation)."""
+    # nan_to_num(...).astype(float32) made two full copies; convert once
+    # and patch non-finite entries through a boolean mask instead
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    mask = ~np.isfinite(X)
+    if mask.any():
+        if not X.flags.writeable:
+            X = X.copy()
+        X[mask] = 0.0
     return X
 
 
@@ -187,54 +262,67 @@ def run_expanding_window_regime_nn(
     splitter = ExpandingWindowSplit(first_prediction_year=first_prediction_year)
     pred_months = list(splitter.get_prediction_months(panel))
     total_months = len(pred_months)
-    all_month = []
-    all_permno = []
-    all_y = []
-    all_mktcap = []
-    all_pred = []
-    trained_models = []
+
+    # Convert the panel to numpy once and slice with the splitter's integer
+    # indices; each fold previously re-materialized growing float64 copies
+    # of the train matrices from the DataFrame
+    X_macro_all = panel[macro_cols].to_numpy(dtype=np.float32)
+    X_char_all = panel[char_cols].to_numpy(dtype=np.float32)
+    y_all = panel[target_col].to_numpy(dtype=np.float32)
+    month_all = panel["month_dt"].to_numpy()
+    permno_all = panel["permno"].to_numpy()
+    has_mktcap = "mktcap_lag" in panel.columns
+    mktcap_all = panel["mktcap_lag"].to_numpy() if has_mktcap else None
+
+    # Preallocated accumulators filled by slice assignment per fold; the
+    # old list.extend path scalarized every numpy value through tolist()
+    n_test_max = int((panel["month_dt"].dt.year >= splitter.first_prediction_year).sum())
+    y_buf = np.empty(n_test_max, dtype=np.float32)
+    pred_buf = np.empty(n_test_max, dtype=np.float32)
+    month_buf = np.empty(n_test_max, dtype=object)
+    permno_buf = np.empty(n_test_max, dtype=np.int64)
+    mktcap_buf = np.empty(n_test_max, dtype=np.float64) if has_mktcap else None
+    pos = 0
 
     last_model = None
-    for idx, (train, test) in enumerate(splitter.split(panel)):
+    for idx, (train_idx, test_idx) in enumerate(splitter.split_indices(panel)):
         if progress_callback and total_months:
             month_label = str(pred_months[idx]) if idx < len(pred_months) else ""
             progress_callback(idx + 1, total_months, month_label)
-        X_macro_train = train[macro_cols].values
-        X_char_train = train[char_cols].values
-        y_train = train[target_col].values
-        X_macro_test = test[macro_cols].values
-        X_char_test = test[char_cols].values
-        y_test = test[target_col].values
+        y_test = y_all[test_idx]
+        k = len(y_test)
 
         # Semi-annual retrain (retrain_every=6): matches ERIS_Optimized_Pipeline
         if idx % retrain_every == 0:
             last_model, _ = train_regime_aware_nn(
-                X_macro_train, X_char_train, y_train,
+                X_macro_all[train_idx], X_char_all[train_idx], y_all[train_idx],
                 epochs=epochs, batch_size=2048,
             )
         model = last_model
         if model is None:
-            all_pred.extend(np.zeros(len(y_test)))
+            pred_buf[pos : pos + k] = 0.0
         else:
-            preds = predict_regime_aware_nn(model, X_macro_test, X_char_test)
-            all_pred.extend(preds)
+            pred_buf[pos : pos + k] = predict_regime_aware_nn(
+                model, X_macro_all[test_idx], X_char_all[test_idx]
+            )
 
-        all_y.extend(y_test)
-        all_month.extend(test["month_dt"].tolist())
-        all_permno.extend(test["permno"].tolist())
-        if "mktcap_lag" in test.columns:
-            all_mktcap.extend(test["mktcap_lag"].tolist())
+        y_buf[pos : pos + k] = y_test
+        month_buf[pos : pos + k] = month_all[test_idx]
+        permno_buf[pos : pos + k] = permno_all[test_idx]
+        if has_mktcap:
+            mktcap_buf[pos : pos + k] = mktcap_all[test_idx]
+        pos += k
 
     out = pd.DataFrame({
-        "month_dt": all_month,
-        "permno": all_permno,
-        "ret_excess": all_y,
-        "pred_RegimeNN": all_pred,
+        "month_dt": pd.array(month_buf[:pos]),
+        "permno": permno_buf[:pos],
+        "ret_excess": y_buf[:pos],
+        "pred_RegimeNN": pred_buf[:pos],
     })
-    if all_mktcap:
-        out["mktcap_lag"] = all_mktcap
-    y_true = np.array(all_y)
-    y_pred = np.array(all_pred)
+    if has_mktcap:
+        out["mktcap_lag"] = mktcap_buf[:pos]
+    y_true = y_buf[:pos]
+    y_pred = pred_buf[:pos]
     metrics = {
         "RegimeNN": {
             "oos_r2": oos_r2(y_true, y_pred),
@@ -4,6 +4,7 @@ Labels: bull/expansion, bear/recession, transition.
 Stress index: weighted combination of term spread, default spread, stock variance.
 """
 
+import functools
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -14,6 +15,7 @@ import yaml
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
+@functools.lru_cache(maxsize=1)
 def _get_config() -> dict:
     config_path = PROJECT_ROOT / "config.yaml"
     if not config_path.exists():
@@ -40,8 +42,13 @@ def fit_regime_hmm(
 
     X = macro_df[macro_cols].values
     X = np.nan_to_num(X, nan=0.0, posinf=0.0, neginf=0.0)
-    # Z-score for stability
-    X = (X - np.nanmean(X, axis=0)) / (np.nanstd(X, axis=0) + 1e-8)
+    # Z-score for stability. X is NaN-free after nan_to_num, so plain
+    # mean/std (no per-element NaN branch) computed once; the stats ride
+    # along on regime_df.attrs so new rows can be scaled identically at
+    # inference instead of re-deriving them on a grown window
+    mu = X.mean(axis=0)
+    sigma = X.std(axis=0) + 1e-8
+    X = (X - mu) / sigma
     model = hmm.GaussianHMM(n_components=n_states, covariance_type="full", n_iter=n_iter, random_state=42)
     model.fit(X)
     states = model.predict(X)
@@ -62,6 +69,7 @@ def fit_regime_hmm(
         "hmm_state": states,
         "regime_label": labels,
     })
+    regime_df.attrs["scaler"] = (mu, sigma)
     return model, states, regime_df
 
 
@@ -80,19 +88,16 @@ def compute_stress_index(
         "macro_dfy": 1.0,
         "macro_svar": 1.0,
     }
-    series = []
-    for col, coef in w.items():
-        if col in macro_df.columns:
-            s = macro_df[col].fillna(0)
-            series.append(coef * s)
-    if not series:
+    cols = [c for c in w if c in macro_df.columns]
+    if not cols:
         return pd.Series(0.0, index=macro_df.index)
-    combined = series[0]
-    for s in series[1:]:
-        combined = combined + s
-    # Normalize to 0-100 (percentile-based)
-    combined = (combined - combined.min()) / (combined.max() - combined.min() + 1e-8) * 100
-    return combined
+    # One matrix-vector product over the stacked columns instead of a
+    # fresh Series allocation per weighted term
+    coefs = np.array([w[c] for c in cols], dtype=np.float64)
+    combined = np.nan_to_num(macro_df[cols].to_numpy(dtype=np.float64)) @ coefs
+    # Normalize to 0-100
+    lo, hi = combined.min(), combined.max()
+    return pd.Series((combined - lo) / (hi - lo + 1e-8) * 100, index=macro_df.index)
 
 
 def run_regime_and_stress(
@@ -3,6 +3,7 @@ Expanding-window validation for time series. No random split — no look-ahead b
 Train on all data up to month t-1, predict month t; roll forward.
 """
 
+import functools
 from pathlib import Path
 from typing import Generator, List, Optional, Tuple
 
@@ -13,6 +14,7 @@ import yaml
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
+@functools.lru_cache(maxsize=1)
 def _get_config() -> dict:
     config_path = PROJECT_ROOT / "config.yaml"
     if not config_path.exists():
@@ -37,26 +39,53 @@ class ExpandingWindowSplit:
         self.first_prediction_year = course.get("first_prediction_year", first_prediction_year)
         self.month_col = month_col
 
-    def split(
+    def split_indices(
         self,
         panel: pd.DataFrame,
-    ) -> Generator[Tuple[pd.DataFrame, pd.DataFrame], None, None]:
+    ) -> Generator[Tuple[np.ndarray, np.ndarray], None, None]:
         """
-        Yields (train_df, test_df) for each out-of-sample month.
-        train_df: all rows with month_dt < pred_month
-        test_df: all rows with month_dt == pred_month
+        Yields (train_idx, test_idx) integer positions for each OOS month,
+        so callers can index precomputed numpy arrays instead of slicing
+        the DataFrame per fold.
         """
         if self.month_col not in panel.columns:
             raise ValueError(f"Panel must have column {self.month_col}")
-        months = panel[self.month_col].drop_duplicates().sort_values()
+        month_series = panel[self.month_col]
+        months = month_series.drop_duplicates().sort_values()
         # Prediction months: first month where year >= first_prediction_year
         pred_months = months[months.dt.year >= self.first_prediction_year]
+        # Compare on period ordinals (ints) rather than Period objects.
+        # Binary-search the month boundaries instead of a full boolean scan
+        # per prediction month (O(M log N) vs O(M*N)); panels sorted by
+        # month (the normal case) skip the argsort entirely.
+        ordinals = month_series.array.asi8
+        if np.all(ordinals[1:] >= ordinals[:-1]):
+            positions = None
+            sorted_ords = ordinals
+        else:
+            positions = np.argsort(ordinals, kind="stable")
+            sorted_ords = ordinals[positions]
         for m in pred_months:
-            train = panel[panel[self.month_col] < m]
-            test = panel[panel[self.month_col] == m]
-            if train.empty or test.empty:
+            lo = np.searchsorted(sorted_ords, m.ordinal, side="left")
+            hi = np.searchsorted(sorted_ords, m.ordinal, side="right")
+            if lo == 0 or lo == hi:
                 continue
-            yield train, test
+            if positions is None:
+                yield np.arange(lo), np.arange(lo, hi)
+            else:
+                yield positions[:lo], positions[lo:hi]
+
+    def split(
+        self,
+        panel: pd.DataFrame,
+    ) -> Generator[Tuple[pd.DataFrame, pd.DataFrame], None, None]:
+        """
+        Yields (train_df, test_df) for each out-of-sample month.
+        train_df: all rows with month_dt < pred_month
+        test_df: all rows with month_dt == pred_month
+        """
+        for train_idx, test_idx in self.split_indices(panel):
+            yield panel.iloc[train_idx], panel.iloc[test_idx]
 
     def get_prediction_months(self, panel: pd.DataFrame) -> pd.PeriodIndex:
         """Return the list of months we predict (OOS)."""
@@ -120,22 +149,25 @@ def regime_conditional_r2(
     left[month_col] = left[month_col].astype(str)
     right = regime_df[[month_col, regime_col]].drop_duplicates()
     right[month_col] = right[month_col].astype(str)
-    merged = left.merge(right, on=month_col, how="left")
-    if merged[regime_col].isna().all():
+    merged = left.merge(right, on=month_col, how="left").dropna(subset=[regime_col])
+    if merged.empty:
         return {}
+    # Grouped sums of squares instead of re-slicing the frame per
+    # (model, regime) pair; SS_tot and group sizes are shared across models
+    regimes = merged[regime_col]
+    grouped = merged.groupby(regime_col)
+    sizes = grouped.size()
+    y_true = merged[ret_col]
+    ss_tot = ((y_true - grouped[ret_col].transform("mean")) ** 2).groupby(regimes).sum()
+    keep = sizes.index[sizes >= 100]
     out = {}
     for model in [c.replace("pred_", "") for c in merged.columns if c.startswith("pred_")]:
         pcol = f"pred_{model}"
-        if pcol not in merged.columns:
-            continue
+        ss_res = ((y_true - merged[pcol]) ** 2).groupby(regimes).sum()
         by_regime = {}
-        for reg in merged[regime_col].dropna().unique():
-            sub = merged[merged[regime_col] == reg]
-            if len(sub) < 100:
-                continue
-            y_true = sub[ret_col].values
-            y_pred = sub[pcol].values
-            by_regime[str(reg)] = round(oos_r2(y_true, y_pred), 6)
+        for reg in keep:
+            r2 = 0.0 if ss_tot[reg] == 0 else float(1 - ss_res[reg] / ss_tot[reg])
+            by_regime[str(reg)] = round(r2, 6)
         if by_regime:
             out[model] = by_regime
     return out
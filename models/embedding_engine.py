@@ -3,6 +3,7 @@ ERIS Semantic embedding layer: daily average embedding, rolling baseline, semant
 Phase 2.
 """
 
+import functools
 import logging
 from typing import List, Optional
 
@@ -12,8 +13,9 @@ from data.storage.db_manager import get_config, get_connection
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_embedding_model():
-    """Load sentence-transformer model."""
+    """Load sentence-transformer model (module-level singleton)."""
     try:
         from sentence_transformers import SentenceTransformer
         cfg = get_config()
@@ -35,6 +37,47 @@ def compute_daily_embedding(documents: List[str], model) -> Optional[np.ndarray]
         return None
 
 
+def compute_daily_embeddings_batch(day_docs: List[List[str]], model) -> List[Optional[np.ndarray]]:
+    """
+    Average embedding per day, encoding all days' documents in one call.
+    One batched encode amortizes tokenization and GPU round-trips over
+    the whole date range instead of paying them per day.
+    """
+    if not model or not day_docs:
+        return [None] * len(day_docs)
+    flat = [doc for docs in day_docs for doc in docs]
+    counts = np.array([len(docs) for docs in day_docs])
+    if not flat:
+        return [None] * len(day_docs)
+    try:
+        embs = model.encode(flat, batch_size=256, convert_to_numpy=True, show_progress_bar=False)
+    except Exception as e:
+        logger.debug("Batch embedding failed: %s", e)
+        return [None] * len(day_docs)
+    # Per-day means via reduceat over the flattened block
+    offsets = np.r_[0, np.cumsum(counts)[:-1]]
+    nonempty = counts > 0
+    sums = np.add.reduceat(embs, offsets[nonempty])
+    means = sums / counts[nonempty, None]
+    out: List[Optional[np.ndarray]] = [None] * len(day_docs)
+    for pos, day_idx in enumerate(np.flatnonzero(nonempty)):
+        out[day_idx] = means[pos]
+    return out
+
+
+def cosine_distance_matrix(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Pairwise cosine distances, shape (len(A), len(B)).
+    One BLAS matmul over normalized rows instead of a Python-level
+    dot product per pair (O(days^2) calls in the drift series).
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=np.float64))
+    B = np.atleast_2d(np.asarray(B, dtype=np.float64))
+    A = A / (np.linalg.norm(A, axis=1, keepdims=True) + 1e-12)
+    B = B / (np.linalg.norm(B, axis=1, keepdims=True) + 1e-12)
+    return 1.0 - A @ B.T
+
+
 def cosine_distance(a: np.ndarray, b: np.ndarray) -> float:
     """Cosine distance = 1 - cosine_similarity."""
     if a is None or b is None or len(a) != len(b):
@@ -17,20 +17,27 @@ REGIME_LABELS = ["Risk-On", "Transitional", "Risk-Off"]
 
 def get_daily_nlp_features() -> pd.DataFrame:
     """Aggregate nlp_signals by date; add sentiment_drift (21d rolling mean diff). Returns daily DataFrame with date index."""
+    # Aggregate inside SQLite (C, one pass) so only D daily rows cross the
+    # driver boundary instead of the whole nlp_signals table
     with get_connection() as conn:
-        df = pd.read_sql_query(
-            "SELECT date, sentiment_score, source_type FROM nlp_signals WHERE date IS NOT NULL AND sentiment_score IS NOT NULL",
+        daily = pd.read_sql_query(
+            """SELECT date,
+                      AVG(sentiment_score) AS sentiment_mean,
+                      AVG(sentiment_score * sentiment_score) AS _m2,
+                      COUNT(sentiment_score) AS doc_count
+               FROM nlp_signals
+               WHERE date IS NOT NULL AND sentiment_score IS NOT NULL
+               GROUP BY date
+               ORDER BY date""",
             conn,
         )
-    if df.empty:
+    if daily.empty:
         return pd.DataFrame()
-    df["date"] = pd.to_datetime(df["date"]).dt.date
-    daily = df.groupby("date").agg(
-        sentiment_mean=("sentiment_score", "mean"),
-        sentiment_std=("sentiment_score", "std"),
-        doc_count=("sentiment_score", "count"),
-    ).reset_index()
-    daily["sentiment_std"] = daily["sentiment_std"].fillna(0)
+    daily["date"] = pd.to_datetime(daily["date"]).dt.date
+    # Sample std (ddof=1, matching the old pandas agg) from the SQL moments
+    n = daily["doc_count"].to_numpy(dtype=float)
+    var = (daily.pop("_m2") - daily["sentiment_mean"] ** 2) * n / np.maximum(n - 1, 1)
+    daily["sentiment_std"] = np.where(n > 1, np.sqrt(np.clip(var, 0, None)), 0.0)
     daily["sentiment_drift"] = daily["sentiment_mean"].rolling(21, min_periods=1).mean().diff().fillna(0)
     return daily.sort_values("date").dropna(subset=["sentiment_mean"])
 
@@ -84,12 +91,11 @@ def run_regime_pipeline() -> int:
     if not model:
         logger.warning("hmmlearn not available; writing placeholder regime.")
         with get_connection() as conn:
-            for _, row in daily.tail(90).iterrows():
-                conn.execute(
-                    """INSERT OR REPLACE INTO regime_states (date, regime_label, regime_probability, confidence, regime_prob_risk_off)
-                       VALUES (?, 'Transitional', 0.5, 'Low', 0.33)""",
-                    (str(row["date"]),),
-                )
+            conn.executemany(
+                """INSERT OR REPLACE INTO regime_states (date, regime_label, regime_probability, confidence, regime_prob_risk_off)
+                   VALUES (?, 'Transitional', 0.5, 'Low', 0.33)""",
+                [(str(d),) for d in daily["date"].tail(90)],
+            )
         return min(90, len(daily))
     hidden = model.predict(X)
     try:
@@ -98,23 +104,31 @@ def run_regime_pipeline() -> int:
         probs = np.eye(3)[hidden]
     emission_means = model.means_
     risk_off_state = int(np.argmin(emission_means[:, 0]))
+    # Vectorize the per-day label/confidence/probability columns and zip
+    # them straight into executemany rows; iterrows built a pandas Series
+    # per day just to read row["date"]
+    dates = daily["date"].astype(str).to_numpy()
+    hidden = np.asarray(hidden, dtype=int)
+    labels = np.array(REGIME_LABELS + ["Transitional"])[np.clip(hidden, 0, 3)]
+    maxp = probs.max(axis=1)
+    conf = np.where(maxp > 0.7, "High", np.where(maxp > 0.5, "Medium", "Low"))
+    if probs.shape[1] > risk_off_state:
+        prob_ro = probs[:, risk_off_state].astype(float)
+    else:
+        prob_ro = np.where(hidden == risk_off_state, 1.0, 0.33)
+    rows = list(zip(dates, labels, prob_ro, conf, prob_ro, hidden.tolist(), prob_ro))
     inserted = 0
     with get_connection() as conn:
-        for i, (_, row) in enumerate(daily.iterrows()):
-            state = int(hidden[i])
-            prob_risk_off = float(probs[i, risk_off_state]) if probs.shape[1] > risk_off_state else (1.0 if state == risk_off_state else 0.33)
-            label = REGIME_LABELS[state] if state < 3 else "Transitional"
-            conf = "High" if np.max(probs[i]) > 0.7 else "Medium" if np.max(probs[i]) > 0.5 else "Low"
-            try:
-                conn.execute(
-                    """INSERT OR REPLACE INTO regime_states
-                       (date, regime_label, regime_probability, confidence, regime_prob_risk_off, hmm_state, composite_prob)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                    (str(row["date"]), label, prob_risk_off, conf, prob_risk_off, state, prob_risk_off),
-                )
-                inserted += 1
-            except Exception as e:
-                logger.debug("Insert regime: %s", e)
+        try:
+            conn.executemany(
+                """INSERT OR REPLACE INTO regime_states
+                   (date, regime_label, regime_probability, confidence, regime_prob_risk_off, hmm_state, composite_prob)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            inserted = len(rows)
+        except Exception as e:
+            logger.debug("Insert regime: %s", e)
     return inserted
 
 
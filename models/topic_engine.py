@@ -3,15 +3,69 @@ ERIS Topic & Narrative Intelligence (BERTopic).
 Phase 2. Fit on corpus; topics_over_time; store topic_id / topic_label in nlp_signals.
 """
 
+import hashlib
 import logging
+from pathlib import Path
 from typing import List, Optional
 
+import numpy as np
+
 from data.storage.db_manager import get_config, get_connection
 
 logger = logging.getLogger(__name__)
 
+_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "cache"
+
+
+def _encode_documents(docs: List[str], doc_ids: List, emb_model_name: str) -> Optional["np.ndarray"]:
+    """
+    Encode the corpus once, cached on disk keyed by (doc ids, model name).
+    Embedding is the most expensive BERTopic stage; re-runs over the same
+    documents load the saved matrix instead of re-encoding.
+    """
+    key = hashlib.blake2b(
+        ("|".join(str(d) for d in doc_ids) + emb_model_name).encode(), digest_size=16
+    ).hexdigest()
+    cache_path = _CACHE_DIR / f"bertopic_emb_{key}.npy"
+    if cache_path.exists():
+        try:
+            emb = np.load(cache_path)
+            if len(emb) == len(docs):
+                return emb
+        except Exception as e:
+            logger.debug("Embedding cache read failed: %s", e)
+    from models.embedding_engine import get_embedding_model
+    model = get_embedding_model()
+    if model is None:
+        return None
+    # Cap sequence length and widen batches; on GPU run the encoder in
+    # fp16 (inference only) for roughly double the throughput
+    try:
+        import torch
+        if torch.cuda.is_available():
+            model.half()
+    except ImportError:
+        pass
+    model.max_seq_length = 128
+    emb = model.encode(
+        docs, batch_size=128, convert_to_numpy=True,
+        show_progress_bar=False, normalize_embeddings=True,
+    )
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.save(cache_path, emb)
+    except Exception as e:
+        logger.debug("Embedding cache write failed: %s", e)
+    return emb
 
-def fit_bertopic(documents: List[str], **kwargs) -> object:
+
+def _model_cache_path(docs: List[str]) -> Path:
+    """Cache path for a fitted BERTopic model, keyed by corpus content."""
+    key = hashlib.blake2b(b"\x00".join(d.encode() for d in docs), digest_size=16).hexdigest()
+    return _CACHE_DIR / f"bertopic_model_{key}"
+
+
+def fit_bertopic(documents: List[str], embeddings: Optional["np.ndarray"] = None, **kwargs) -> object:
     """Fit BERTopic on document list. Returns fitted model.
     Uses smaller cluster sizes for small corpora so more docs get real topics (not all 'Other'/outlier).
     """
@@ -30,20 +84,32 @@ def fit_bertopic(documents: List[str], **kwargs) -> object:
         # Small corpus: use smaller clusters so we get real topics, not one big "Other"
         min_cluster_size = max(3, min(default_min_size, max(4, n_docs // 40)))
         min_samples = max(2, min(default_min_samples, max(2, n_docs // 150)))
+        n_neighbors = min(bt_cfg.get("umap_n_neighbors", 15), max(5, n_docs // 10))
+        n_components = min(bt_cfg.get("umap_n_components", 5), max(2, n_docs // 50))
+        umap_model = hdbscan_model = None
+        # UMAP + HDBSCAN dominate fit time on corpora of thousands; use the
+        # RAPIDS GPU implementations when cuML is installed (config toggle
+        # nlp.bertopic.use_gpu), else fall back to the CPU libraries
+        if bt_cfg.get("use_gpu", True):
+            try:
+                from cuml.cluster import HDBSCAN as cuHDBSCAN
+                from cuml.manifold import UMAP as cuUMAP
+                umap_model = cuUMAP(n_neighbors=n_neighbors, n_components=n_components, min_dist=0.0)
+                hdbscan_model = cuHDBSCAN(min_cluster_size=min_cluster_size, min_samples=min_samples)
+                logger.info("BERTopic clustering on GPU via cuML.")
+            except ImportError:
+                pass
+        if umap_model is None:
+            umap_model = umap.UMAP(n_neighbors=n_neighbors, n_components=n_components, min_dist=0.0)
+            hdbscan_model = hdbscan.HDBSCAN(min_cluster_size=min_cluster_size, min_samples=min_samples)
         model = BERTopic(
             embedding_model=SentenceTransformer(emb_model),
-            umap_model=umap.UMAP(
-                n_neighbors=min(bt_cfg.get("umap_n_neighbors", 15), max(5, n_docs // 10)),
-                n_components=min(bt_cfg.get("umap_n_components", 5), max(2, n_docs // 50)),
-                min_dist=0.0,
-            ),
-            hdbscan_model=hdbscan.HDBSCAN(
-                min_cluster_size=min_cluster_size,
-                min_samples=min_samples,
-            ),
+            umap_model=umap_model,
+            hdbscan_model=hdbscan_model,
             **kwargs,
         )
-        model.fit(documents)
+        # Precomputed embeddings skip BERTopic's internal encode pass
+        model.fit(documents, embeddings=embeddings)
         return model
     except ImportError as e:
         logger.warning("BERTopic deps missing: %s", e)
@@ -66,7 +132,7 @@ def run_topic_pipeline(limit: int = 2000) -> int:
     with get_connection() as conn:
         cur = conn.cursor()
         cur.execute(
-            """SELECT id, content_clean, published_date, source_type FROM documents_processed
+            """SELECT id, content_clean, published_date, source_type, topic_hint FROM documents_processed
                WHERE content_clean IS NOT NULL AND length(content_clean) > 100 AND published_date IS NOT NULL
                ORDER BY published_date ASC LIMIT ?""",
             (limit,),
@@ -76,28 +142,66 @@ def run_topic_pipeline(limit: int = 2000) -> int:
         logger.warning("No documents_processed rows for BERTopic.")
         return 0
     docs = [r[1] for r in rows]
-    model = fit_bertopic(docs)
-    if model is None:
-        return 0
-    topics = model.topics_
+    emb_model_name = get_config().get("nlp", {}).get("sentence_transformer", "all-MiniLM-L6-v2")
+    # Fitting dominates pipeline cost; a saved model keyed by corpus content
+    # lets unchanged re-runs skip the fit and only transform (assign topics
+    # to) rows that still lack a topic_hint
+    model_path = _model_cache_path(docs)
+    model = None
+    if model_path.exists():
+        try:
+            from bertopic import BERTopic
+            model = BERTopic.load(str(model_path))
+            logger.info("Loaded cached BERTopic model (corpus unchanged).")
+        except Exception as e:
+            logger.debug("BERTopic model cache load failed: %s", e)
+            model = None
+    if model is not None:
+        pending = [i for i, r in enumerate(rows) if not r[4]]
+        if not pending:
+            return 0
+        try:
+            topics, _ = model.transform([docs[i] for i in pending])
+        except Exception as e:
+            logger.debug("BERTopic transform failed: %s", e)
+            return 0
+        rows = [rows[i] for i in pending]
+    else:
+        embeddings = _encode_documents(docs, [r[0] for r in rows], emb_model_name)
+        model = fit_bertopic(docs, embeddings=embeddings)
+        if model is None:
+            return 0
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            model.save(str(model_path))
+        except Exception as e:
+            logger.debug("BERTopic model cache write failed: %s", e)
+        topics = model.topics_
     labels_map = _topic_labels_from_model(model)
     if not labels_map:
         labels_map = {-1: "Outlier"}
     # Force topic -1 to always display as Outlier (not "Other") for UI consistency
     labels_map[-1] = "Outlier"
+    # Topic ids are small non-negative ints plus -1 for outliers: index a
+    # label lookup table once instead of a dict lookup + f-string per doc
+    topics_arr = np.asarray(
+        [int(t) if t is not None else -1 for t in topics[: len(rows)]], dtype=np.int64
+    )
+    max_t = int(topics_arr.max()) if topics_arr.size else -1
+    label_lut = np.array(
+        [labels_map.get(t, "Outlier" if t == -1 else f"Topic_{t}") for t in range(-1, max_t + 1)],
+        dtype=object,
+    )
+    labels = label_lut[topics_arr + 1]
+    updates = list(zip(labels.tolist(), (r[0] for r in rows)))
+    # One executemany in one transaction instead of N autocommitted UPDATEs
     updated = 0
-    with get_connection() as conn:
-        for i, raw_id in enumerate(topics):
-            if i >= len(rows):
-                break
-            topic_id = int(raw_id) if raw_id is not None else -1
-            doc_id = rows[i][0]
-            label = labels_map.get(topic_id, "Outlier" if topic_id == -1 else f"Topic_{topic_id}")
-            try:
-                conn.execute("UPDATE documents_processed SET topic_hint = ? WHERE id = ?", (label, doc_id))
-                updated += 1
-            except Exception as e:
-                logger.debug("Update topic_hint: %s", e)
+    try:
+        with get_connection() as conn:
+            conn.executemany("UPDATE documents_processed SET topic_hint = ? WHERE id = ?", updates)
+        updated = len(updates)
+    except Exception as e:
+        logger.debug("Update topic_hint batch: %s", e)
     return updated
 
 
@@ -44,5 +44,6 @@ else:
     for c in ["sentiment_positive_prob", "sentiment_negative_prob", "sentiment_neutral_prob", "sentiment_confidence"]:
         if c in show.columns:
             num = pd.to_numeric(show[c], errors="coerce")
-            show[c] = num.apply(lambda x: f"{x:.0%}" if pd.notna(x) else "")
+            # Vectorized percent formatting (no per-row lambda)
+            show[c] = ((num * 100).round().astype("Int64").astype(str) + "%").where(num.notna(), "")
     st.dataframe(show, use_container_width=True)
@@ -71,9 +71,9 @@ else:
     display["date"] = pd.to_datetime(display["date"]).dt.strftime("%Y-%m-%d")
     for col in ["regime_probability", "regime_prob_risk_off", "composite_prob"]:
         if col in display.columns:
-            display[col] = display[col].apply(
-                lambda x: f"{float(x):.0%}" if x is not None and str(x) != "nan" else ""
-            )
+            num = pd.to_numeric(display[col], errors="coerce")
+            # Vectorized percent formatting (no per-row lambda)
+            display[col] = ((num * 100).round().astype("Int64").astype(str) + "%").where(num.notna(), "")
     cols_show = ["date", "regime_label", "confidence", "regime_probability", "regime_prob_risk_off"]
     if "drivers" in display.columns and display["drivers"].notna().any():
         cols_show.append("drivers")
@@ -1,5 +1,8 @@
 """ERIS AI Risk Briefing — complete risk briefing and mitigation paths (GPT)."""
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+import pandas as pd
 import streamlit as st
 from components.data_loader import get_latest_regime, load_regime_states, load_daily_sentiment, load_topic_distribution
 from components.ui_theme import inject_theme, render_insight
@@ -13,10 +16,17 @@ st.caption("Complete risk briefing and mitigation paths for stakeholders (GPT-4)
 
 days = st.session_state.get("days", 365)
 source_filter = None if st.session_state.get("data_source", "all") == "all" else st.session_state.get("data_source")
-regime = get_latest_regime()
-regime_df = load_regime_states(days=min(days, 90))
-daily_sent = load_daily_sentiment(days=min(days, 90), source_type=source_filter)
-topic_dist = load_topic_distribution(days=min(days, 365))
+# Four independent reads; SQLite (WAL) releases the GIL around I/O, so
+# running them concurrently costs only the slowest query instead of the sum
+with ThreadPoolExecutor(max_workers=4) as ex:
+    f_regime = ex.submit(get_latest_regime)
+    f_hist = ex.submit(load_regime_states, min(days, 90))
+    f_sent = ex.submit(load_daily_sentiment, min(days, 90), source_filter)
+    f_top = ex.submit(load_topic_distribution, min(days, 365))
+regime = f_regime.result()
+regime_df = f_hist.result()
+daily_sent = f_sent.result()
+topic_dist = f_top.result()
 stress_info = get_stress_info(regime, regime_df, daily_sent)
 
 if regime:
@@ -33,9 +43,14 @@ if regime:
 
     regime_trend = get_regime_trend_summary(regime_df, last_n=min(30, len(regime_df))) if not regime_df.empty else "No regime history."
     if not daily_sent.empty and "daily_mean_sentiment" in daily_sent.columns:
-        mean_s = daily_sent["daily_mean_sentiment"].iloc[-1]
-        trend_s = "improving" if mean_s is not None and len(daily_sent) > 1 and mean_s > daily_sent["daily_mean_sentiment"].iloc[0] else "weakening" if mean_s is not None else "neutral"
-        sentiment_trend = f"Latest daily mean {mean_s:.2f}; trend {trend_s}."
+        # One NumPy view instead of repeated .iloc Series accesses
+        arr = daily_sent["daily_mean_sentiment"].to_numpy()
+        mean_s = float(arr[-1])
+        if math.isnan(mean_s):
+            sentiment_trend = "No sentiment data."
+        else:
+            trend_s = "improving" if arr.size > 1 and mean_s > arr[0] else "weakening"
+            sentiment_trend = f"Latest daily mean {mean_s:.2f}; trend {trend_s}."
     else:
         sentiment_trend = "No sentiment data."
     topic_summary = get_topic_trend_summary(topic_dist, top_n=5) if not topic_dist.empty else "No topic data."
@@ -75,8 +90,10 @@ if regime:
         st.json(regime)
     st.subheader("Recent history")
     if not regime_df.empty:
-        h = regime_df[["date", "regime_label", "confidence"]].head(20).copy()
-        h["date"] = h["date"].astype(str)
+        # Slice the 20 display rows first, then format the date in one assign;
+        # no explicit copy — st.dataframe serializes its own
+        h = regime_df.head(20).loc[:, ["date", "regime_label", "confidence"]]
+        h = h.assign(date=pd.to_datetime(h["date"]).dt.strftime("%Y-%m-%d"))
         st.dataframe(h, use_container_width=True)
 else:
     st.info("Regime data is not yet available.")